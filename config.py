@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Configuration loader for British Days application.
+Parses config.json once per process and reuses it until the file changes.
+"""
+import os
+import json
+import functools
+from pathlib import Path
+
+try:
+    import orjson  # Optional: faster JSON parsing
+except ImportError:
+    orjson = None
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(config_path, mtime):
+    """Parse a JSON config file. Keyed on mtime so edits are picked up."""
+    data = Path(config_path).read_bytes()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def load_config(config_path='config.json'):
+    """
+    Load configuration from a JSON file.
+    The returned dict is shared between callers and must not be mutated.
+    Raises FileNotFoundError if the file does not exist.
+    """
+    return _load_config_cached(config_path, os.path.getmtime(config_path))
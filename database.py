@@ -6,10 +6,36 @@ Handles SQLite database operations for storing British slang/phrases.
 import sqlite3
 import os
 import sys
-import json
 from datetime import datetime
 from pathlib import Path
 import threading
+import weakref
+from config import load_config
+
+
+class _SharedConnection:
+    """Connection, lock and caches shared by every DatabaseManager for one database file."""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.conn = None
+        self.known_terms = None  # Cached lowercase terms; None means stale
+        self.stats = None  # Cached row counts; None means stale
+
+
+# One _SharedConnection per database path, released once no manager uses it
+_CONNECTION_POOL = weakref.WeakValueDictionary()
+_CONNECTION_POOL_LOCK = threading.Lock()
+
+
+def _get_shared_connection(db_path):
+    """Get the pooled connection state for db_path, creating it if needed."""
+    with _CONNECTION_POOL_LOCK:
+        shared = _CONNECTION_POOL.get(db_path)
+        if shared is None:
+            shared = _SharedConnection()
+            _CONNECTION_POOL[db_path] = shared
+        return shared
 
 
 class DatabaseManager:
@@ -20,14 +46,14 @@ class DatabaseManager:
         self.config = self._load_config(config_path)
         self.data_dir = self._get_data_directory()
         self.db_path = os.path.join(self.data_dir, self.config.get('database_name', 'british_slang.db'))
-        self._lock = threading.Lock()
+        self._shared = _get_shared_connection(self.db_path)
+        self._lock = self._shared.lock
         self._initialize_database()
     
     def _load_config(self, config_path):
-        """Load configuration from JSON file."""
+        """Load configuration from JSON file (cached until the file changes)."""
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return load_config(config_path)
         except FileNotFoundError:
             return {
                 'data_directory': 'Data',
@@ -48,10 +74,25 @@ class DatabaseManager:
         return data_dir
     
     def _get_connection(self):
-        """Get a database connection with proper settings."""
-        conn = sqlite3.connect(self.db_path, timeout=10.0, check_same_thread=False)
-        conn.execute("PRAGMA journal_mode=WAL")
-        return conn
+        """Get the persistent database connection, opening it on first use.
+        
+        The connection is pooled per database path and reused by every
+        manager for that file, so the file open and PRAGMA setup happen
+        once rather than on every call. Callers must hold self._lock.
+        """
+        if self._shared.conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10.0, check_same_thread=False)
+            conn.row_factory = sqlite3.Row  # Rows support both index and name access
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._shared.conn = conn
+        return self._shared.conn
+    
+    def close(self):
+        """Close the shared database connection (reopened on next use)."""
+        with self._lock:
+            if self._shared.conn is not None:
+                self._shared.conn.close()
+                self._shared.conn = None
     
     def _initialize_database(self):
         """Create database tables if they don't exist."""
@@ -62,8 +103,9 @@ class DatabaseManager:
             # Check if we need to migrate (add new columns)
             cursor.execute("PRAGMA table_info(slang_terms)")
             columns = [col[1] for col in cursor.fetchall()]
+            tables = self._get_tables(cursor)
             
-            if 'slang_terms' not in self._get_tables(cursor):
+            if 'slang_terms' not in tables:
                 # Create new table
                 cursor.execute('''
                     CREATE TABLE slang_terms (
@@ -85,6 +127,8 @@ class DatabaseManager:
                 if 'pronunciation' not in columns:
                     cursor.execute('ALTER TABLE slang_terms ADD COLUMN pronunciation TEXT')
             
+            self._fts_enabled = self._initialize_fts(cursor)
+            
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS search_history (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -95,7 +139,66 @@ class DatabaseManager:
             ''')
             
             conn.commit()
-            conn.close()
+    
+    def _initialize_fts(self, cursor):
+        """Create the FTS5 index over slang_terms. Returns False if FTS5 is unavailable."""
+        try:
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS slang_terms_fts USING fts5(
+                    term, definition, example, polish,
+                    content='slang_terms', content_rowid='id'
+                )
+            ''')
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5 - search_terms falls back to LIKE
+            return False
+        
+        # Keep the external-content index in sync with slang_terms
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS slang_terms_fts_insert
+            AFTER INSERT ON slang_terms
+            BEGIN
+                INSERT INTO slang_terms_fts (rowid, term, definition, example, polish)
+                VALUES (NEW.id, NEW.term, NEW.definition, NEW.example, NEW.polish);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS slang_terms_fts_delete
+            AFTER DELETE ON slang_terms
+            BEGIN
+                INSERT INTO slang_terms_fts (slang_terms_fts, rowid, term, definition, example, polish)
+                VALUES ('delete', OLD.id, OLD.term, OLD.definition, OLD.example, OLD.polish);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS slang_terms_fts_update
+            AFTER UPDATE OF term, definition, example, polish ON slang_terms
+            BEGIN
+                INSERT INTO slang_terms_fts (slang_terms_fts, rowid, term, definition, example, polish)
+                VALUES ('delete', OLD.id, OLD.term, OLD.definition, OLD.example, OLD.polish);
+                INSERT INTO slang_terms_fts (rowid, term, definition, example, polish)
+                VALUES (NEW.id, NEW.term, NEW.definition, NEW.example, NEW.polish);
+            END
+        ''')
+        
+        # Index rows that existed before the FTS table was created. Checked by
+        # row count rather than table existence: the DDL above commits on its
+        # own, so an interrupted first start can leave an empty index behind.
+        cursor.execute('SELECT COUNT(*) FROM slang_terms')
+        total_terms = cursor.fetchone()[0]
+        cursor.execute('SELECT COUNT(*) FROM slang_terms_fts_docsize')
+        if cursor.fetchone()[0] != total_terms:
+            cursor.execute("INSERT INTO slang_terms_fts (slang_terms_fts) VALUES ('rebuild')")
+        
+        return True
+    
+    def _build_fts_query(self, search_query):
+        """Turn free text into an FTS5 prefix query, e.g. 'dead chuf' -> '"dead"* "chuf"*'."""
+        tokens = [token.replace('"', '') for token in search_query.split()]
+        tokens = [token for token in tokens if any(ch.isalnum() for ch in token)]
+        if not tokens:
+            return None
+        return ' '.join(f'"{token}"*' for token in tokens)
     
     def _get_tables(self, cursor):
         """Get list of existing tables."""
@@ -105,8 +208,8 @@ class DatabaseManager:
     def add_term(self, term, definition='', example='', category='slang', source='internet', polish='', pronunciation=''):
         """Add a new slang term to the database."""
         with self._lock:
+            conn = self._get_connection()
             try:
-                conn = self._get_connection()
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -115,25 +218,53 @@ class DatabaseManager:
                 ''', (term, definition, example, category, source, polish, pronunciation))
                 
                 conn.commit()
+                self._shared.known_terms = None
+                self._shared.stats = None
                 term_id = cursor.lastrowid
-                conn.close()
                 
                 return True, term_id
             except sqlite3.IntegrityError:
-                if conn:
-                    conn.close()
+                conn.rollback()
                 return False, None
             except Exception as e:
-                if conn:
-                    conn.close()
+                conn.rollback()
                 print(f"Error adding term: {e}")
                 return False, None
     
+    def add_terms_bulk(self, rows):
+        """Add several terms in a single transaction.
+        
+        Each row is (term, definition, example, category, source, polish, pronunciation).
+        Returns a list of new term IDs aligned with rows; None marks a duplicate or failure.
+        """
+        with self._lock:
+            conn = self._get_connection()
+            try:
+                cursor = conn.cursor()
+                
+                term_ids = []
+                for row in rows:
+                    cursor.execute('''
+                        INSERT OR IGNORE INTO slang_terms (term, definition, example, category, source, polish, pronunciation)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ''', row)
+                    term_ids.append(cursor.lastrowid if cursor.rowcount == 1 else None)
+                
+                conn.commit()
+                self._shared.known_terms = None
+                self._shared.stats = None
+                
+                return term_ids
+            except Exception as e:
+                conn.rollback()
+                print(f"Error adding terms: {e}")
+                return [None] * len(rows)
+    
     def update_term(self, term_id, term, definition='', example='', category='slang', polish='', pronunciation=''):
         """Update an existing term."""
         with self._lock:
+            conn = self._get_connection()
             try:
-                conn = self._get_connection()
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -143,29 +274,28 @@ class DatabaseManager:
                 ''', (term, definition, example, category, polish, pronunciation, term_id))
                 
                 conn.commit()
-                conn.close()
+                self._shared.known_terms = None
                 return True
             except Exception as e:
-                if conn:
-                    conn.close()
+                conn.rollback()
                 print(f"Error updating term: {e}")
                 return False
     
     def delete_term(self, term_id):
         """Delete a term from the database."""
         with self._lock:
+            conn = self._get_connection()
             try:
-                conn = self._get_connection()
                 cursor = conn.cursor()
                 
                 cursor.execute('DELETE FROM slang_terms WHERE id=?', (term_id,))
                 
                 conn.commit()
-                conn.close()
+                self._shared.known_terms = None
+                self._shared.stats = None
                 return True
             except Exception as e:
-                if conn:
-                    conn.close()
+                conn.rollback()
                 print(f"Error deleting term: {e}")
                 return False
     
@@ -182,10 +312,23 @@ class DatabaseManager:
             ''')
             
             terms = cursor.fetchall()
-            conn.close()
             
             return terms
     
+    def get_known_terms(self):
+        """Get the set of all terms (lowercased), e.g. for duplicate checks.
+        
+        The set is cached in memory and rebuilt only after terms are added,
+        updated or deleted.
+        """
+        with self._lock:
+            if self._shared.known_terms is None:
+                cursor = self._get_connection().cursor()
+                cursor.execute('SELECT term FROM slang_terms')
+                self._shared.known_terms = frozenset(row['term'].lower() for row in cursor.fetchall())
+            
+            return self._shared.known_terms
+    
     def get_term_by_id(self, term_id):
         """Get a specific term by ID."""
         with self._lock:
@@ -199,25 +342,37 @@ class DatabaseManager:
             ''', (term_id,))
             
             term = cursor.fetchone()
-            conn.close()
             
             return term
     
     def search_terms(self, search_query):
-        """Search for terms matching the query."""
+        """Search for terms matching the query (case-insensitive).
+        
+        Uses the FTS5 index for word-prefix matches when available,
+        otherwise a substring scan with LIKE.
+        """
+        fts_query = self._build_fts_query(search_query) if self._fts_enabled else None
+        
         with self._lock:
             conn = self._get_connection()
             cursor = conn.cursor()
             
-            cursor.execute('''
-                SELECT id, term, definition, example, category, date_added, source, polish, pronunciation
-                FROM slang_terms
-                WHERE term LIKE ? OR definition LIKE ? OR example LIKE ? OR polish LIKE ?
-                ORDER BY date_added DESC
-            ''', (f'%{search_query}%', f'%{search_query}%', f'%{search_query}%', f'%{search_query}%'))
+            if fts_query:
+                cursor.execute('''
+                    SELECT t.id, t.term, t.definition, t.example, t.category, t.date_added, t.source, t.polish, t.pronunciation
+                    FROM slang_terms_fts
+                    JOIN slang_terms t ON t.id = slang_terms_fts.rowid
+                    WHERE slang_terms_fts MATCH ?
+                ''', (fts_query,))
+            else:
+                cursor.execute('''
+                    SELECT id, term, definition, example, category, date_added, source, polish, pronunciation
+                    FROM slang_terms
+                    WHERE term LIKE ?1 OR definition LIKE ?1 OR example LIKE ?1 OR polish LIKE ?1
+                    ORDER BY date_added DESC
+                ''', (f'%{search_query}%',))
             
             terms = cursor.fetchall()
-            conn.close()
             
             return terms
     
@@ -233,24 +388,24 @@ class DatabaseManager:
             ''', (search_term, result_count))
             
             conn.commit()
-            conn.close()
+            self._shared.stats = None
     
     def get_database_stats(self):
-        """Get statistics about the database."""
+        """Get statistics about the database (cached until terms or history change)."""
         with self._lock:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT COUNT(*) FROM slang_terms')
-            total_terms = cursor.fetchone()[0]
-            
-            cursor.execute('SELECT COUNT(*) FROM search_history')
-            total_searches = cursor.fetchone()[0]
-            
-            conn.close()
+            if self._shared.stats is None:
+                conn = self._get_connection()
+                cursor = conn.cursor()
+                
+                cursor.execute('SELECT COUNT(*) FROM slang_terms')
+                total_terms = cursor.fetchone()[0]
+                
+                cursor.execute('SELECT COUNT(*) FROM search_history')
+                total_searches = cursor.fetchone()[0]
+                
+                self._shared.stats = {
+                    'total_terms': total_terms,
+                    'total_searches': total_searches
+                }
             
-            return {
-                'total_terms': total_terms,
-                'total_searches': total_searches,
-                'database_path': self.db_path
-            }
+            return dict(self._shared.stats, database_path=self.db_path)
@@ -74,7 +74,8 @@ def create_logo(size, filename):
     img.save(filename)
     print(f"Created {filename}")
 
-if __name__ == '__main__':
+def main():
+    """Generate all PNG assets into the assets directory."""
     assets_dir = 'assets'
     os.makedirs(assets_dir, exist_ok=True)
     
@@ -87,3 +88,6 @@ if __name__ == '__main__':
     create_logo(100, f'{assets_dir}/logo.png')
     
     print("\nAll PNG assets created successfully!")
+
+if __name__ == '__main__':
+    main()
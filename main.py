@@ -8,9 +8,9 @@ from tkinter import ttk, messagebox, scrolledtext
 from PIL import Image, ImageTk
 import os
 import sys
-import json
 import threading
 import time
+from config import load_config
 from database import DatabaseManager
 from search import SlangSearcher
 
@@ -22,9 +22,13 @@ class AssetLoader:
         self.assets_dir = assets_dir
         self.cache = {}
     
-    def load(self, filename, size=None):
-        """Load image file (png, gif, ico, bmp, jpg) and optionally scale."""
-        key = f"{filename}_{size}"
+    def load(self, filename, size=None, need_alpha=True):
+        """Load image file (png, gif, ico, bmp, jpg) and optionally scale.
+        
+        Opaque images (e.g. backgrounds) can pass need_alpha=False to skip
+        the RGBA conversion and keep the smaller RGB buffer.
+        """
+        key = f"{filename}_{size}_{need_alpha}"
         if key in self.cache:
             return self.cache[key]
         
@@ -32,9 +36,12 @@ class AssetLoader:
             path = os.path.join(self.assets_dir, filename)
             img = Image.open(path)
             
-            # Convert to RGBA if needed
-            if img.mode != 'RGBA':
-                img = img.convert('RGBA')
+            # Convert to RGBA only if transparency is needed
+            if need_alpha:
+                if img.mode != 'RGBA':
+                    img = img.convert('RGBA')
+            elif img.mode not in ('RGB', 'RGBA'):
+                img = img.convert('RGB')
             
             # Scale if size specified
             if size:
@@ -46,6 +53,17 @@ class AssetLoader:
         except Exception as e:
             print(f"Failed to load {filename}: {e}")
             return None
+    
+    def load_rotations(self, filename, size, step=30):
+        """Load image as a list of frames rotated clockwise by `step` degrees."""
+        try:
+            path = os.path.join(self.assets_dir, filename)
+            img = Image.open(path).convert('RGBA').resize(size, Image.Resampling.LANCZOS)
+            return [ImageTk.PhotoImage(img.rotate(-angle, resample=Image.Resampling.BICUBIC))
+                    for angle in range(0, 360, step)]
+        except Exception as e:
+            print(f"Failed to load {filename}: {e}")
+            return []
 
 
 class BritishDaysApp:
@@ -65,6 +83,7 @@ class BritishDaysApp:
         self.is_searching = False
         self.search_thread = None
         self.search_gif_frame = 0
+        self._stop_event = threading.Event()
         
         # Setup window
         self._setup_window()
@@ -72,17 +91,24 @@ class BritishDaysApp:
         # Load all assets
         self._load_all_assets()
         
-        # Create GUI
-        self._create_gui()
-        
-        # Load initial data
-        self.refresh_display()
+        # Create window chrome now; build the data panel and load data
+        # once the window is mapped and the chrome has been painted
+        self._create_chrome()
+        self._map_binding = self.canvas.bind('<Map>', self._on_first_map)
+    
+    def _on_first_map(self, event):
+        """Build the data panel after the first paint of the window chrome."""
+        self.canvas.unbind('<Map>', self._map_binding)
+        
+        # Flush the pending redraws so the chrome is on screen first
+        self.root.update_idletasks()
+        self.root.after_idle(self._create_data_panel)
+        self.root.after_idle(self.refresh_display)
     
     def _load_config(self):
         """Load configuration."""
         try:
-            with open('config.json', 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return load_config('config.json')
         except:
             return {
                 'window_title': 'British Days - Slang Collector',
@@ -114,7 +140,7 @@ class BritishDaysApp:
     def _load_all_assets(self):
         """Load all GUI assets."""
         # Main images - adjust sizes as needed
-        self.img_background = self.assets.load('background.png', (1920, 1080))  # Background: 1920x1080
+        self.img_background = self.assets.load('background.png', (1920, 1080), need_alpha=False)  # Background: 1920x1080
         self.img_logo = self.assets.load('logo.png', (100, 100))  # Logo: 100x100
         self.img_panel = self.assets.load('panel_main.png', (800, 600))  # Panel: 800x600
         
@@ -132,17 +158,17 @@ class BritishDaysApp:
         except:
             pass
         
-        # Load search progress GIF (animated)
-        # For now, we'll use static image and animate manually
+        # Search progress icon (50x50) and its rotated frames, built once
         self.img_search_progress = self.assets.load('btn_search.png', (50, 50))  # Reuse: 50x50
+        self._spinner_frames = self.assets.load_rotations('btn_search.png', (50, 50))
         
         # Small icons for buttons: 24x24
         self.img_icon_edit = self.assets.load('btn_refresh.png', (24, 24))  # Reuse as edit icon
         self.img_icon_delete = self.assets.load('btn_exit.png', (24, 24))  # Reuse as delete icon
         self.img_icon_add = self.assets.load('btn_search.png', (24, 24))  # Reuse as add icon
     
-    def _create_gui(self):
-        """Create the main GUI."""
+    def _create_chrome(self):
+        """Create the background, header and left control panel."""
         # Main canvas with background
         self.canvas = tk.Canvas(
             self.root,
@@ -185,6 +211,9 @@ class BritishDaysApp:
         # Control buttons with images
         y_pos = 20
         
+        # Controls that need the data panel stay disabled until it is built
+        self._data_controls = []
+        
         # Search button with icon
         if self.img_btn_search:
             btn_search = tk.Button(
@@ -194,9 +223,11 @@ class BritishDaysApp:
                 borderwidth=0,
                 cursor='hand2',
                 bg='#34495E',
-                activebackground='#2C3E50'
+                activebackground='#2C3E50',
+                state=tk.DISABLED
             )
             btn_search.place(x=85, y=y_pos)
+            self._data_controls.append(btn_search)
             y_pos += 70
         
         # Stop button
@@ -249,9 +280,11 @@ class BritishDaysApp:
                 fg='#ECF0F1',
                 selectcolor='#2C3E50',
                 activebackground='#34495E',
-                activeforeground='#ECF0F1'
+                activeforeground='#ECF0F1',
+                state=tk.DISABLED
             )
             rb.place(x=20, y=y_pos)
+            self._data_controls.append(rb)
             y_pos += 30
         
         y_pos += 10
@@ -273,15 +306,17 @@ class BritishDaysApp:
             font=('Arial', 14),
             bg='#ECF0F1',
             fg='#2C3E50',
-            width=25
+            width=25,
+            state=tk.DISABLED
         )
         self.search_entry.place(x=10, y=y_pos)
+        self._data_controls.append(self.search_entry)
         # Real-time search on key release
         self.search_entry.bind('<KeyRelease>', lambda e: self.search_database_realtime())
         y_pos += 40
         
         # Clear search button
-        tk.Button(
+        btn_show_all = tk.Button(
             panel_left_frame,
             text="Pokaż wszystko",
             command=self.refresh_display,
@@ -289,8 +324,11 @@ class BritishDaysApp:
             bg='#3498DB',
             fg='white',
             cursor='hand2',
-            width=22
-        ).place(x=10, y=y_pos)
+            width=22,
+            state=tk.DISABLED
+        )
+        btn_show_all.place(x=10, y=y_pos)
+        self._data_controls.append(btn_show_all)
         y_pos += 50
         
         ttk.Separator(panel_left_frame, orient=tk.HORIZONTAL).place(x=10, y=y_pos, width=300)
@@ -317,9 +355,11 @@ class BritishDaysApp:
             cursor='hand2',
             width=22,
             image=self.img_icon_edit if self.img_icon_edit else None,
-            compound=tk.LEFT
+            compound=tk.LEFT,
+            state=tk.DISABLED
         )
         btn_edit.place(x=10, y=y_pos)
+        self._data_controls.append(btn_edit)
         y_pos += 40
         
         # Delete button with icon
@@ -333,9 +373,11 @@ class BritishDaysApp:
             cursor='hand2',
             width=22,
             image=self.img_icon_delete if self.img_icon_delete else None,
-            compound=tk.LEFT
+            compound=tk.LEFT,
+            state=tk.DISABLED
         )
         btn_delete.place(x=10, y=y_pos)
+        self._data_controls.append(btn_delete)
         y_pos += 50
         
         ttk.Separator(panel_left_frame, orient=tk.HORIZONTAL).place(x=10, y=y_pos, width=300)
@@ -352,7 +394,9 @@ class BritishDaysApp:
                 activebackground='#2C3E50'
             )
             btn_exit.place(x=85, y=780)
-        
+    
+    def _create_data_panel(self):
+        """Create the right-hand data panel (terms tree, log and progress bar)."""
         # ===== CENTER/RIGHT PANEL - DATA DISPLAY =====
         # Main data panel: 1500x850 at (400, 150)
         panel_right_frame = tk.Frame(self.canvas, bg='#ECF0F1', bd=2, relief=tk.RAISED)
@@ -446,6 +490,10 @@ class BritishDaysApp:
         self.progress_bar = ttk.Progressbar(log_label_frame, mode='indeterminate')
         self.progress_bar.pack(fill=tk.X, padx=10, pady=(0, 5))
         
+        # The tree and progress bar exist now, so the left-panel controls can run
+        for widget in self._data_controls:
+            widget.config(state=tk.NORMAL)
+        
         # Initial log message
         self.log_message("Aplikacja gotowa do działania! Kliknij 'Search' aby znaleźć nowe frazy.", "INFO")
     
@@ -473,13 +521,17 @@ class BritishDaysApp:
         self.root.update()
     
     def animate_search_icon(self):
-        """Animate the search progress icon (rotate)."""
-        if self.is_searching and hasattr(self, 'progress_icon'):
-            # Simple rotation animation
-            self.search_gif_frame = (self.search_gif_frame + 10) % 360
-            # Note: For actual rotation, you'd need to rotate the image
-            # For now, just show it's active
+        """Animate the search progress icon using the pre-rotated frames."""
+        if not hasattr(self, 'progress_icon') or not self._spinner_frames:
+            return
+        
+        if self.is_searching:
+            self.search_gif_frame = (self.search_gif_frame + 1) % len(self._spinner_frames)
+            self.progress_canvas.itemconfig(self.progress_icon, image=self._spinner_frames[self.search_gif_frame])
             self.root.after(100, self.animate_search_icon)
+        else:
+            self.search_gif_frame = 0
+            self.progress_canvas.itemconfig(self.progress_icon, image=self.img_search_progress)
     
     def start_auto_search(self):
         """Start automatic search in background thread."""
@@ -487,6 +539,7 @@ class BritishDaysApp:
             return
         
         self.is_searching = True
+        self._stop_event.clear()
         if hasattr(self, 'btn_stop'):
             self.btn_stop.config(state=tk.NORMAL)
         self.progress_bar.start(10)
@@ -501,21 +554,25 @@ class BritishDaysApp:
         """Worker thread for automatic searching."""
         search_count = 0
         max_searches = 50
+        batch_size = 10
+        batch_interval = 5.0
+        pending_adds = []
+        last_flush = time.monotonic()
         
-        while self.is_searching and search_count < max_searches:
+        while not self._stop_event.is_set() and search_count + len(pending_adds) < max_searches:
             try:
-                existing_terms = {term[1].lower() for term in self.db.get_all_terms()}
+                known_terms = self.db.get_known_terms()
                 result = self.searcher.search_new_slang()
                 
                 if result:
                     term_lower = result['term'].lower()
                     
-                    if term_lower in existing_terms:
+                    if term_lower in known_terms or any(row[0].lower() == term_lower for row in pending_adds):
                         self.root.after(0, self.log_message, 
                                       f"Duplikat: '{result['term']}' już jest w bazie danych", 
                                       "DUPLICATE")
                     else:
-                        success, term_id = self.db.add_term(
+                        pending_adds.append((
                             result['term'],
                             result['definition'],
                             result.get('example', ''),
@@ -523,26 +580,50 @@ class BritishDaysApp:
                             result.get('source', 'internet'),
                             result.get('polish', ''),
                             result.get('pronunciation', '')
-                        )
-                        
-                        if success:
-                            self.root.after(0, self.log_message, 
-                                          f"✅ Dodano: '{result['term']}' - {result['definition'][:40]}...", 
-                                          "SUCCESS")
-                            self.root.after(0, self.refresh_display)
-                            search_count += 1
-                        else:
-                            self.root.after(0, self.log_message, 
-                                          f"Nie udało się dodać: '{result['term']}'", 
-                                          "ERROR")
+                        ))
+                
+                # Commit and redraw once per batch rather than per term
+                if len(pending_adds) >= batch_size or time.monotonic() - last_flush >= batch_interval:
+                    search_count += self._flush_pending_adds(pending_adds)
+                    pending_adds = []
+                    last_flush = time.monotonic()
                 
-                time.sleep(0.8)
+                # Wait between searches, waking immediately on stop
+                if self._stop_event.wait(0.8):
+                    break
                 
             except Exception as e:
                 self.root.after(0, self.log_message, f"Błąd: {str(e)}", "ERROR")
                 break
         
-        self.root.after(0, self._search_completed, search_count)
+        # When stopped by shutdown() the main loop is already gone, so posting
+        # the UI callbacks fails; the terms are written before that happens
+        try:
+            search_count += self._flush_pending_adds(pending_adds)
+            self.root.after(0, self._search_completed, search_count)
+        except (RuntimeError, tk.TclError):
+            pass
+    
+    def _flush_pending_adds(self, rows):
+        """Write queued terms in one transaction and refresh the display once."""
+        if not rows:
+            return 0
+        
+        added = 0
+        for row, term_id in zip(rows, self.db.add_terms_bulk(rows)):
+            if term_id is not None:
+                self.root.after(0, self.log_message, 
+                              f"✅ Dodano: '{row[0]}' - {row[1][:40]}...", 
+                              "SUCCESS")
+                added += 1
+            else:
+                self.root.after(0, self.log_message, 
+                              f"Nie udało się dodać: '{row[0]}'", 
+                              "ERROR")
+        
+        if added:
+            self.root.after(0, self.refresh_display)
+        return added
     
     def _search_completed(self, count):
         """Called when search is completed."""
@@ -554,8 +635,8 @@ class BritishDaysApp:
     
     def stop_search(self):
         """Stop the automatic search."""
-        if self.is_searching:
-            self.is_searching = False
+        if self.is_searching and not self._stop_event.is_set():
+            self._stop_event.set()
             self.log_message("⏹ Zatrzymywanie wyszukiwania...", "INFO")
     
     def search_database_realtime(self):
@@ -577,21 +658,14 @@ class BritishDaysApp:
         # Apply sorting
         terms = self._sort_terms(terms)
         
-        # Populate tree with highlighting
+        # Populate tree with highlighting - every row returned by
+        # search_terms already matches, so no per-row comparison is needed
+        tags = ('highlight',) if highlight else ()
         for term in terms:
-            term_id, term_name, definition, example, category, date_added, source, polish, pronunciation = term
-            
-            item_id = self.tree.insert('', tk.END, text=str(term_id), 
-                           values=(term_name, definition, example or '', category or '', 
-                                   polish or '', pronunciation or ''))
-            
-            # Highlight if search active
-            if highlight and query:
-                if (query in term_name.lower() or 
-                    query in (definition or '').lower() or 
-                    query in (example or '').lower() or
-                    query in (polish or '').lower()):
-                    self.tree.item(item_id, tags=('highlight',))
+            self.tree.insert('', tk.END, text=str(term['id']), tags=tags,
+                             values=(term['term'], term['definition'], term['example'] or '',
+                                     term['category'] or '', term['polish'] or '',
+                                     term['pronunciation'] or ''))
         
         # Update stats
         self._update_stats()
@@ -600,15 +674,15 @@ class BritishDaysApp:
         """Sort terms based on selected option."""
         sort_option = self.sort_var.get()
         if sort_option == "date_asc":
-            return sorted(terms, key=lambda x: x[5])
+            return sorted(terms, key=lambda x: x['date_added'])
         elif sort_option == "date_desc":
-            return sorted(terms, key=lambda x: x[5], reverse=True)
+            return sorted(terms, key=lambda x: x['date_added'], reverse=True)
         elif sort_option == "term_asc":
-            return sorted(terms, key=lambda x: x[1].lower())
+            return sorted(terms, key=lambda x: x['term'].lower())
         elif sort_option == "term_desc":
-            return sorted(terms, key=lambda x: x[1].lower(), reverse=True)
+            return sorted(terms, key=lambda x: x['term'].lower(), reverse=True)
         elif sort_option == "category":
-            return sorted(terms, key=lambda x: (x[4] or '', x[1].lower()))
+            return sorted(terms, key=lambda x: (x['category'] or '', x['term'].lower()))
         return terms
     
     def refresh_display(self):
@@ -659,6 +733,13 @@ class BritishDaysApp:
         
         if messagebox.askokcancel("Wyjście", "Czy na pewno chcesz wyjść z aplikacji?"):
             self.root.quit()
+    
+    def shutdown(self):
+        """Stop the auto-search worker, let it flush its batch, then close the database."""
+        self._stop_event.set()
+        if self.search_thread is not None:
+            self.search_thread.join(timeout=5.0)
+        self.db.close()
 
 
 class EditDialog:
@@ -676,7 +757,12 @@ class EditDialog:
         self.dialog.grab_set()
         self.dialog.configure(bg='#ECF0F1')
         
-        term_id, term, definition, example, category, date_added, source, polish, pronunciation = term_data
+        term = term_data['term']
+        definition = term_data['definition']
+        example = term_data['example']
+        category = term_data['category']
+        polish = term_data['polish']
+        pronunciation = term_data['pronunciation']
         
         frame = tk.Frame(self.dialog, bg='#ECF0F1', padx=20, pady=20)
         frame.pack(fill=tk.BOTH, expand=True)
@@ -738,7 +824,7 @@ class EditDialog:
     
     def save(self):
         """Save changes."""
-        term_id = self.term_data[0]
+        term_id = self.term_data['id']
         term = self.term_entry.get().strip()
         definition = self.def_text.get('1.0', tk.END).strip()
         polish = self.polish_text.get('1.0', tk.END).strip()
@@ -760,6 +846,7 @@ def main():
     root = tk.Tk()
     app = BritishDaysApp(root)
     root.mainloop()
+    app.shutdown()
 
 
 if __name__ == '__main__':
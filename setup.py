@@ -6,6 +6,10 @@ Installs dependencies and generates assets.
 import subprocess
 import sys
 import os
+import io
+import contextlib
+import importlib
+import traceback
 
 
 def run_command(cmd, description):
@@ -21,6 +25,29 @@ def run_command(cmd, description):
         return False
 
 
+def run_function(func, description):
+    """Run a function in-process and report status like run_command."""
+    print(f"\n{description}...")
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            func()
+        print(f"✓ {description} completed")
+        return True
+    except Exception:
+        print(f"✗ {description} failed:")
+        print(output.getvalue(), end='')
+        print(traceback.format_exc())
+        return False
+
+
+def generate_assets_main():
+    """Import generate_assets (after dependencies are installed) and run it."""
+    importlib.invalidate_caches()  # Pick up packages installed by pip in this run
+    import generate_assets
+    generate_assets.main()
+
+
 def main():
     """Main setup routine."""
     print("=" * 60)
@@ -41,11 +68,8 @@ def main():
     ):
         return False
     
-    # Step 3: Generate PNG assets
-    if not run_command(
-        [sys.executable, 'generate_assets.py'],
-        "Generating PNG assets"
-    ):
+    # Step 3: Generate PNG assets (in-process, avoids starting another interpreter)
+    if not run_function(generate_assets_main, "Generating PNG assets"):
         return False
     
     # Step 4: Verify assets
@@ -56,10 +80,13 @@ def main():
     ]
     
     print("\nVerifying assets...")
+    # One directory listing instead of a stat() per asset
+    with os.scandir(assets_dir) as entries:
+        found = {entry.name for entry in entries if entry.is_file()}
+    
     all_exist = True
     for asset in required_assets:
-        path = os.path.join(assets_dir, asset)
-        if os.path.exists(path):
+        if asset in found:
             print(f"  ✓ {asset}")
         else:
             print(f"  ✗ {asset} missing")
@@ -2,19 +2,20 @@
 """
 Test script for British Days application (headless mode).
 Tests database and search functionality without GUI.
+
+Run directly (python test_app.py) or collect with pytest.
 """
 import os
 import sys
+import traceback
 
-print("=" * 60)
-print("British Days Application - Test Suite")
-print("=" * 60)
+from config import load_config
+from database import DatabaseManager
+from search import SlangSearcher
 
-# Test 1: Database Module
-print("\n1. Testing Database Module...")
-try:
-    from database import DatabaseManager
-    
+
+def test_database_module():
+    """Test 1: Database Module."""
     db = DatabaseManager()
     print(f"   ✓ Database initialized")
     print(f"   ✓ Location: {db.db_path}")
@@ -27,20 +28,23 @@ try:
     # Get stats
     stats = db.get_database_stats()
     print(f"   ✓ Database stats: {stats['total_terms']} terms")
-    
-    # Clean up - delete the db object
-    del db
-    
-    print("   ✓ Database module: PASSED")
-except Exception as e:
-    print(f"   ✗ Database module: FAILED - {e}")
-    sys.exit(1)
+    assert stats['total_terms'] >= 1
+    
+    # Writes through a second manager on the same file invalidate the shared caches
+    assert "zzcacheprobe" not in db.get_known_terms()
+    other = DatabaseManager()
+    success, tid = other.add_term("Zzcacheprobe", "Cache probe", "", "test")
+    assert success, "Could not add probe term"
+    try:
+        assert db.get_database_stats()['total_terms'] == stats['total_terms'] + 1
+        assert "zzcacheprobe" in db.get_known_terms()
+        print(f"   ✓ Caches refreshed after write from another manager")
+    finally:
+        other.delete_term(tid)
 
-# Test 2: Search Module
-print("\n2. Testing Search Module...")
-try:
-    from search import SlangSearcher
-    
+
+def test_search_module():
+    """Test 2: Search Module."""
     searcher = SlangSearcher()
     print(f"   ✓ Searcher initialized")
     
@@ -48,35 +52,38 @@ try:
     result = searcher.search_new_slang()
     print(f"   ✓ Search returned: {result['term']}")
     print(f"   ✓ Definition: {result['definition'][:50]}...")
-    
-    print("   ✓ Search module: PASSED")
-except Exception as e:
-    print(f"   ✗ Search module: FAILED - {e}")
-    sys.exit(1)
+    assert result['term']
+    
+    # Filter by category
+    result = searcher.search_new_slang(category='food')
+    assert result['category'] == 'food'
+    print(f"   ✓ Category search returned: {result['term']}")
+    assert searcher.search_new_slang(category='no_such_category') is None
+    print(f"   ✓ Unknown category returns None")
+
 
-# Test 3: Integration Test
-print("\n3. Testing Integration (Search + Database)...")
-try:
-    # Recreate database manager for this test
+def test_integration():
+    """Test 3: Integration (Search + Database)."""
     db = DatabaseManager()
+    searcher = SlangSearcher()
     
-    # Search for 5 new terms and add to database
-    added_count = 0
-    duplicate_count = 0
-    
+    # Search for 5 new terms and add them to the database in one transaction
+    rows = []
     for i in range(5):
         result = searcher.search_new_slang()
-        success, tid = db.add_term(
+        rows.append((
             result['term'],
             result['definition'],
             result.get('example', ''),
             result.get('category', 'slang'),
-            'test'
-        )
-        if success:
-            added_count += 1
-        else:
-            duplicate_count += 1
+            'test',
+            result.get('polish', ''),
+            result.get('pronunciation', '')
+        ))
+    
+    term_ids = db.add_terms_bulk(rows)
+    added_count = sum(1 for tid in term_ids if tid is not None)
+    duplicate_count = len(rows) - added_count
     
     print(f"   ✓ Added {added_count} new terms")
     print(f"   ✓ Skipped {duplicate_count} duplicates")
@@ -89,35 +96,49 @@ try:
     terms = db.get_all_terms()
     print(f"\n   Sample terms from database:")
     for i, term in enumerate(terms[:3], 1):
-        term_id, term_name, definition, example, category, date_added, source = term
-        print(f"   {i}. {term_name}: {definition[:40]}...")
-    
-    print("\n   ✓ Integration test: PASSED")
-except Exception as e:
-    print(f"   ✗ Integration test: FAILED - {e}")
-    import traceback
-    traceback.print_exc()
-    sys.exit(1)
+        print(f"   {i}. {term['term']}: {term['definition'][:40]}...")
+    assert terms
 
-# Test 4: Configuration
-print("\n4. Testing Configuration...")
-try:
-    import json
+
+def test_database_search():
+    """Test 4: Database Search (FTS index and LIKE fallback)."""
+    db = DatabaseManager()
     
-    with open('config.json', 'r') as f:
-        config = json.load(f)
+    success, tid = db.add_term("Zzquibble", "Probe definition ~~", "Probe example", "test")
+    assert success, "Could not add probe term"
+    try:
+        # Word-prefix match
+        assert tid in [row['id'] for row in db.search_terms("zzquib")]
+        print(f"   ✓ Found new term by word prefix")
+        
+        # Updates replace the indexed text
+        db.update_term(tid, "Zzwobble", "Changed definition ~~", "Probe example", "test")
+        assert tid not in [row['id'] for row in db.search_terms("zzquib")]
+        assert tid in [row['id'] for row in db.search_terms("zzwob")]
+        print(f"   ✓ Search follows updated term")
+        
+        # Queries without word characters use the LIKE fallback
+        assert db._build_fts_query("~~") is None
+        assert tid in [row['id'] for row in db.search_terms("~~")]
+        print(f"   ✓ Non-word query uses LIKE fallback")
+    finally:
+        db.delete_term(tid)
+    
+    assert not db.search_terms("zzwob")
+    print(f"   ✓ Deleted term no longer found")
+
+
+def test_configuration():
+    """Test 5: Configuration."""
+    config = load_config('config.json')
     
     print(f"   ✓ Config loaded")
     print(f"   ✓ Window title: {config['window_title']}")
     print(f"   ✓ Data directory: {config['data_directory']}")
-    print(f"   ✓ Configuration: PASSED")
-except Exception as e:
-    print(f"   ✗ Configuration: FAILED - {e}")
-    sys.exit(1)
-
-# Test 5: Assets
-print("\n5. Testing PNG Assets...")
-try:
+
+
+def test_assets():
+    """Test 6: PNG Assets."""
     assets_dir = 'assets'
     required_assets = [
         'background.png',
@@ -128,29 +149,51 @@ try:
         'logo.png'
     ]
     
-    missing = []
-    for asset in required_assets:
-        path = os.path.join(assets_dir, asset)
-        if not os.path.exists(path):
-            missing.append(asset)
-    
-    if missing:
-        print(f"   ✗ Missing assets: {', '.join(missing)}")
-        sys.exit(1)
+    with os.scandir(assets_dir) as entries:
+        found = {entry.name for entry in entries if entry.is_file()}
+    missing = [asset for asset in required_assets if asset not in found]
     
+    assert not missing, f"Missing assets: {', '.join(missing)}"
     print(f"   ✓ All {len(required_assets)} PNG assets found")
-    print(f"   ✓ Assets: PASSED")
-except Exception as e:
-    print(f"   ✗ Assets: FAILED - {e}")
-    sys.exit(1)
-
-print("\n" + "=" * 60)
-print("ALL TESTS PASSED ✓")
-print("=" * 60)
-print("\nApplication is ready to run!")
-print("Note: GUI requires a display server to test interactively.")
-print("\nTo run the application:")
-print("  python main.py")
-print("\nTo build Windows executable:")
-print("  python build.py")
-print("=" * 60)
+
+
+TESTS = [
+    ("1. Testing Database Module...", test_database_module, "Database module"),
+    ("2. Testing Search Module...", test_search_module, "Search module"),
+    ("3. Testing Integration (Search + Database)...", test_integration, "Integration test"),
+    ("4. Testing Database Search...", test_database_search, "Database search"),
+    ("5. Testing Configuration...", test_configuration, "Configuration"),
+    ("6. Testing PNG Assets...", test_assets, "Assets"),
+]
+
+
+def main():
+    """Run all tests in order, stopping at the first failure."""
+    print("=" * 60)
+    print("British Days Application - Test Suite")
+    print("=" * 60)
+    
+    for title, test, name in TESTS:
+        print(f"\n{title}")
+        try:
+            test()
+            print(f"   ✓ {name}: PASSED")
+        except Exception as e:
+            print(f"   ✗ {name}: FAILED - {e}")
+            traceback.print_exc()
+            sys.exit(1)
+    
+    print("\n" + "=" * 60)
+    print("ALL TESTS PASSED ✓")
+    print("=" * 60)
+    print("\nApplication is ready to run!")
+    print("Note: GUI requires a display server to test interactively.")
+    print("\nTo run the application:")
+    print("  python main.py")
+    print("\nTo build Windows executable:")
+    print("  python build.py")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()